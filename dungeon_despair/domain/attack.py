@@ -1,18 +1,16 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from dungeon_despair.domain.utils import AttackType
 
 
 class Attack(BaseModel):
-	class Config:
-		arbitrary_types_allowed = True
-		use_enum_values = True
+	model_config = ConfigDict(extra='forbid', use_enum_values=True)
 	
-	name: str = Field(..., description="The name of the attack.", required=True)
-	description: str = Field(..., description='The description of the attack', required=True)
+	name: str = Field(..., description="The name of the attack.")
+	description: str = Field(..., description='The description of the attack')
 	type: AttackType = Field(..., description='The attack type: must be one of "damage" or "heal".')
-	starting_positions: str = Field(..., description='The starting positions of the attack', required=True)
-	target_positions: str = Field(..., description='The positions targeted by the attack', required=True)
-	base_dmg: float = Field(..., description='The base attack damage. Use a negative value for "heal" attacks to indicate the amount of HP that can be recovered.', required=True)
+	starting_positions: str = Field(..., description='The starting positions of the attack')
+	target_positions: str = Field(..., description='The positions targeted by the attack')
+	base_dmg: float = Field(..., description='The base attack damage. Use a negative value for "heal" attacks to indicate the amount of HP that can be recovered.')
 	accuracy: float = Field(..., description='The attack accuracy (a percentage between 0.0 and 1.0).')
-	active: bool = Field(default=True, description='Whether the attack can be executed', required=False)
\ No newline at end of file
+	active: bool = Field(default=True, description='Whether the attack can be executed')
\ No newline at end of file
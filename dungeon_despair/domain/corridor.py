@@ -1,6 +1,6 @@
 from typing import List, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from dungeon_despair.domain.configs import config
 from dungeon_despair.domain.encounter import Encounter
@@ -8,23 +8,19 @@ from dungeon_despair.domain.utils import Direction
 
 
 class Corridor(BaseModel):
-	class Config:
-		arbitrary_types_allowed = True
-		use_enum_values = True
+	model_config = ConfigDict(arbitrary_types_allowed=True, use_enum_values=True)
 	
-	room_from: str = Field(..., description="The room the corridor is connected to.", required=True)
-	room_to: str = Field(..., description="The room the corridor is connects to.", required=True)
-	direction: Direction = Field(Direction.NORTH, description="The direction of the corridor (room_from to room_to).",
-	                             required=True)
-	name: str = Field('', description='The name of the corridor.', required=True)
-	length: int = Field(default=config.corridor_min_length, description="The length of the corridor", required=True)
-	encounters: List[Encounter] = Field(default=[Encounter() for _ in range(config.corridor_min_length)],
-	                                    description="The encounters in the corridor.", required=True)
-	coords: List[Tuple[int, int]] = Field(default=[], description='The coordinates of the room.', required=True)
-	sprites: List[str] = Field(default=[], description='The sprite for the corridor.', required=False)
+	room_from: str = Field(..., description="The room the corridor is connected to.")
+	room_to: str = Field(..., description="The room the corridor is connects to.")
+	direction: Direction = Field(Direction.NORTH, description="The direction of the corridor (room_from to room_to).")
+	name: str = Field('', description='The name of the corridor.')
+	length: int = Field(default=config.corridor_min_length, description="The length of the corridor")
+	encounters: List[Encounter] = Field(default_factory=lambda: [Encounter.model_construct() for _ in range(config.corridor_min_length)],
+	                                    description="The encounters in the corridor.")
+	coords: List[Tuple[int, int]] = Field(default=[], description='The coordinates of the room.')
+	sprites: List[str] = Field(default=[], description='The sprite for the corridor.')
 	
 	def __str__(self):
-		s = f'{self.name}: from {self.room_from} to {self.room_to}, {self.length} cells long;'
-		for i, e in enumerate(self.encounters):
-			s += f'\nCell {i + 1} {str(e)}'
-		return s
+		s = [f'{self.name}: from {self.room_from} to {self.room_to}, {self.length} cells long;']
+		s.extend([f'\nCell {i + 1} {e}' for i, e in enumerate(self.encounters)])
+		return ''.join(s)
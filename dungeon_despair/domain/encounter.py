@@ -1,42 +1,74 @@
-from typing import Dict, List
+from typing import Any, Dict, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from dungeon_despair.domain.entities.entity import Entity
-from dungeon_despair.domain.utils import EntityEnum
+from dungeon_despair.domain.utils import EntityEnum, ENEMY_KEY, TRAP_KEY, TREASURE_KEY
+
+
+def _empty_entities() -> Dict[str, List[Entity]]:
+    return {ENEMY_KEY: [], TRAP_KEY: [], TREASURE_KEY: []}
 
 
 class Encounter(BaseModel):
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     entities: Dict[str, List[Entity]] = Field(
-        default={k.value: [] for k in EntityEnum},
-        description="The entities for this encounter.", required=True)
+        default_factory=_empty_entities,
+        description="The entities for this encounter.")
+    # entity type -> {entity name: position in the entities list}
+    _name_index: Dict[str, Dict[str, int]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._rebuild_name_index()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        super().__setstate__(state)
+        # pickles may predate the name index
+        self._rebuild_name_index()
+
+    def _rebuild_name_index(self) -> None:
+        self._name_index = {k: {entity.name: i for i, entity in enumerate(v)} for k, v in self.entities.items()}
 
     def __str__(self):
-        s = ''
-        for k in self.entities.keys():
-            s += f'\n\t{str(k).lower()}: {"; ".join([str(x) for x in self.entities[k]])}'
-        return s
+        return ''.join([f'\n\t{k}: {"; ".join(map(str, v))}' for k, v in self.entities.items()])
+
+    def has_entity(self,
+                   entity_type: EntityEnum,
+                   entity_name: str) -> bool:
+        return entity_name in self._name_index.get(entity_type, {})
+
+    def get_entity_by_name(self,
+                           entity_type: EntityEnum,
+                           entity_name: str) -> Entity:
+        return self.entities[entity_type][self._name_index[entity_type][entity_name]]
 
     def add_entity(self,
                    entity_type: EntityEnum,
                    entity: Entity) -> None:
-        self.entities[entity_type.value].append(entity)
+        entities = self.entities[entity_type]
+        self._name_index.setdefault(entity_type, {})[entity.name] = len(entities)
+        entities.append(entity)
 
     def replace_entity(self,
                        ref_name: str,
                        entity_type: EntityEnum,
                        new_entity: Entity) -> None:
-        idx = [entity.name for entity in self.entities[entity_type.value]].index(ref_name)
-        prev_entity = self.entities[entity_type.value][idx]
+        name_index = self._name_index[entity_type]
+        idx = name_index.pop(ref_name)
+        prev_entity = self.entities[entity_type][idx]
         if prev_entity.description == new_entity.description:
             new_entity.sprite = prev_entity.sprite
-        self.entities[entity_type.value][idx] = new_entity
+        self.entities[entity_type][idx] = new_entity
+        name_index[new_entity.name] = idx
 
     def remove_entity_by_name(self,
                               entity_type: EntityEnum,
                               entity_name: str) -> None:
-        idx = [entity.name for entity in self.entities[entity_type.value]].index(entity_name)
-        self.entities[entity_type.value].pop(idx)
+        name_index = self._name_index[entity_type]
+        idx = name_index.pop(entity_name)
+        entities = self.entities[entity_type]
+        entities.pop(idx)
+        # entity order is meaningful (e.g.: enemy positions), so shift the following entries
+        for entity in entities[idx:]:
+            name_index[entity.name] -= 1
@@ -7,12 +7,12 @@ from dungeon_despair.domain.entities.entity import Entity
 
 
 class Enemy(Entity):
-	species: str = Field(..., description="The enemy species.", required=True)
-	hp: float = Field(..., description="The enemy HP.", required=True)
-	dodge: float = Field(..., description="The enemy dodge stat.", required=True)
-	prot: float = Field(..., description="The enemy prot stat.", required=True)
-	spd: float = Field(..., description="The enemy spd stat.", required=True)
-	attacks: List[Attack] = Field([], description='The enemy attacks', required=True)
+	species: str = Field(..., description="The enemy species.")
+	hp: float = Field(..., description="The enemy HP.")
+	dodge: float = Field(..., description="The enemy dodge stat.")
+	prot: float = Field(..., description="The enemy prot stat.")
+	spd: float = Field(..., description="The enemy spd stat.")
+	attacks: List[Attack] = Field(default_factory=list, description='The enemy attacks')
 
 	def __str__(self):
 		return f'Enemy {super().__str__()} Species={self.species} HP={self.hp} DODGE={self.dodge} PROT={self.prot} SPD={self.spd}'
@@ -1,13 +1,12 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Entity(BaseModel):
-	class Config:
-		arbitrary_types_allowed = True
+	model_config = ConfigDict(extra='forbid')
 	
-	name: str = Field(..., description="The name of the entity.", required=True)
-	description: str = Field(..., description="The description of the entity.", required=True)
-	sprite: str = Field(default=None, description='The sprite for the entity.', required=False)
+	name: str = Field(..., description="The name of the entity.")
+	description: str = Field(..., description="The description of the entity.")
+	sprite: str = Field(default=None, description='The sprite for the entity.')
 	
 	def __str__(self):
 		return f'{self.name}: {self.description}'
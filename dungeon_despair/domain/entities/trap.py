@@ -4,7 +4,7 @@ from dungeon_despair.domain.entities.entity import Entity
 
 
 class Trap(Entity):
-	effect: str = Field(..., description="The effect of the trap.", required=True)
+	effect: str = Field(..., description="The effect of the trap.")
 
 	def __str__(self):
 		return f'Trap {super().__str__()} Effect={self.effect}'
\ No newline at end of file
@@ -4,7 +4,7 @@ from dungeon_despair.domain.entities.entity import Entity
 
 
 class Treasure(Entity):
-	loot: str = Field(..., description="The loot in the treasure.", required=True)
+	loot: str = Field(..., description="The loot in the treasure.")
 
 	def __str__(self):
 		return f'Treasure {super().__str__()} Loot={self.loot}'
\ No newline at end of file
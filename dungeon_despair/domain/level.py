@@ -1,9 +1,9 @@
 import os
 import pickle
-from typing import Dict, Tuple, Optional, List
+from collections import deque
+from typing import Any, Dict, Tuple, Optional, List
 
-import PIL
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from dungeon_despair.domain.configs import config
 from dungeon_despair.domain.corridor import Corridor
@@ -11,99 +11,198 @@ from dungeon_despair.domain.room import Room
 from dungeon_despair.domain.utils import Direction
 
 
+def _read_images(image_paths: List[str]) -> Dict[str, bytes]:
+	images = {}
+	for image_path in image_paths:
+		with open(os.path.join(config.temp_dir, image_path), 'rb') as f:
+			images[image_path] = f.read()
+	return images
+
+
+def _write_images(images: Dict[str, bytes]) -> None:
+	for image_path, image in images.items():
+		if isinstance(image, bytes):
+			with open(os.path.join(config.temp_dir, image_path), 'wb') as f:
+				f.write(image)
+		else:
+			# older files store PIL images
+			image.save(os.path.join(config.temp_dir, image_path))
+
+
+def _rooms_pair(room_a: str, room_b: str) -> Tuple[str, str]:
+	return (room_a, room_b) if room_a <= room_b else (room_b, room_a)
+
+
 class Level(BaseModel):
-	class Config:
-		arbitrary_types_allowed = True
-		use_enum_values = True
+	model_config = ConfigDict(arbitrary_types_allowed=True, use_enum_values=True)
 
-	rooms: Dict[str, Room] = Field(default={}, description="The rooms in the level.", required=True)
-	corridors: Dict[str, Corridor] = Field(default={}, description="The corridors in the level.", required=True)
-	connections: Dict[str, Dict[Direction, str]] = Field(default={}, description="The connections in the level.", required=True)
+	rooms: Dict[str, Room] = Field(default={}, description="The rooms in the level.")
+	corridors: Dict[str, Corridor] = Field(default={}, description="The corridors in the level.")
+	connections: Dict[str, Dict[Direction, str]] = Field(default={}, description="The connections in the level.")
+	
+	current_room: str = Field(default='', description="The currently selected room.")
+	
+	# coordinates -> name of the room or corridor occupying them
+	_coords_index: Dict[Tuple[int, int], str] = PrivateAttr(default_factory=dict)
+	# room name -> names of the corridors connected to the room
+	_room_to_corridors: Dict[str, List[str]] = PrivateAttr(default_factory=dict)
+	# (room name, room name), sorted -> name of the corridor between the two rooms
+	_corridor_pairs: Dict[Tuple[str, str], str] = PrivateAttr(default_factory=dict)
+	
+	def model_post_init(self, __context: Any) -> None:
+		self._rebuild_indexes()
+	
+	def __setstate__(self, state: Dict[str, Any]) -> None:
+		super().__setstate__(state)
+		# pickles may predate the indexes
+		self._rebuild_indexes()
+	
+	def _rebuild_indexes(self) -> None:
+		self._coords_index = {}
+		self._room_to_corridors = {}
+		self._corridor_pairs = {}
+		for room in self.rooms.values():
+			self._coords_index[room.coords] = room.name
+		for corridor in self.corridors.values():
+			self._index_corridor(corridor)
+	
+	def _index_corridor(self, corridor: Corridor) -> None:
+		for coords in corridor.coords:
+			self._coords_index[coords] = corridor.name
+		self._room_to_corridors.setdefault(corridor.room_from, []).append(corridor.name)
+		self._room_to_corridors.setdefault(corridor.room_to, []).append(corridor.name)
+		self._corridor_pairs[_rooms_pair(corridor.room_from, corridor.room_to)] = corridor.name
+	
+	def _unindex_area(self, coords: List[Tuple[int, int]], name: str) -> None:
+		for xy in coords:
+			if self._coords_index.get(xy) == name:
+				del self._coords_index[xy]
+	
+	def _unindex_corridor(self, corridor: Corridor) -> None:
+		self._unindex_area(corridor.coords, corridor.name)
+		for room_name in (corridor.room_from, corridor.room_to):
+			room_corridors = self._room_to_corridors.get(room_name, [])
+			if corridor.name in room_corridors:
+				room_corridors.remove(corridor.name)
+			if not room_corridors:
+				self._room_to_corridors.pop(room_name, None)
+		pair = _rooms_pair(corridor.room_from, corridor.room_to)
+		if self._corridor_pairs.get(pair) == corridor.name:
+			del self._corridor_pairs[pair]
+	
+	def add_room(self, room: Room) -> None:
+		"""Add (or replace) a room, keeping the level indexes up to date."""
+		if room.name in self.rooms:
+			self._unindex_area([self.rooms[room.name].coords], room.name)
+		self.rooms[room.name] = room
+		self._coords_index[room.coords] = room.name
 	
-	current_room: str = Field(default='', description="The currently selected room.", required=True)
+	def pop_room(self, room_name: str) -> Room:
+		"""Remove a room, keeping the level indexes up to date. Corridors and connections are left untouched."""
+		room = self.rooms.pop(room_name)
+		self._unindex_area([room.coords], room_name)
+		return room
+	
+	def add_corridor(self, corridor: Corridor) -> None:
+		"""Add (or replace) a corridor, keeping the level indexes up to date."""
+		if corridor.name in self.corridors:
+			self._unindex_corridor(self.corridors[corridor.name])
+		self.corridors[corridor.name] = corridor
+		self._index_corridor(corridor)
+	
+	def pop_corridor(self, corridor_name: str) -> Corridor:
+		"""Remove a corridor, keeping the level indexes up to date. Connections are left untouched."""
+		corridor = self.corridors.pop(corridor_name)
+		self._unindex_corridor(corridor)
+		return corridor
+	
+	def get_area_by_coords(self, coords: Tuple[int, int]) -> str:
+		return self._coords_index.get(coords, '')
 	
 	def save_to_file(self, filename: str, conversation: str) -> None:
-		all_images = os.listdir(config.temp_dir)
-		images = {image_path: PIL.Image.open(os.path.join(config.temp_dir, image_path)) for image_path in all_images}
 		bin_data = {
 			'level': self,
-			'images': images,
+			'images': _read_images(os.listdir(config.temp_dir)),
 			'conversation': conversation
 		}
 		with open(filename, 'wb') as f:
-			pickle.dump(bin_data, f)
+			pickle.dump(bin_data, f, protocol=pickle.HIGHEST_PROTOCOL)
 	
 	@staticmethod
 	def load_from_file(filename: str) -> Tuple["Level", str]:
 		with open(filename, 'rb') as f:
 			bin_data = pickle.load(f)
-			images = bin_data['images']
-			for fpath, image in images.items():
-				image.save(os.path.join(config.temp_dir, fpath))
+			_write_images(bin_data['images'])
 			return bin_data['level'], bin_data['conversation']
 	
 	def export_level_as_scenario(self,
 	                             filename: str) -> None:
 		# get all sprites
-		all_sprites = []
+		all_sprites = set()
 		for room in self.rooms.values():
-			all_sprites.append(os.path.basename(room.sprite))
-			for entity_type in room.encounter.entities.keys():
-				for entity in room.encounter.entities[entity_type]:
-					all_sprites.append(os.path.basename(entity.sprite))
+			all_sprites.add(room.sprite)
+			for entities in room.encounter.entities.values():
+				all_sprites.update([entity.sprite for entity in entities])
 		for corridor in self.corridors.values():
-			all_sprites.extend([os.path.basename(x) for x in corridor.sprites])
+			all_sprites.update(corridor.sprites)
 			for encounter in corridor.encounters:
-				for entity_type in encounter.entities.keys():
-					for entity in encounter.entities[entity_type]:
-						all_sprites.append(os.path.basename(entity.sprite))
-		sprites = {sprite_path: PIL.Image.open(os.path.join(config.temp_dir, sprite_path)) for sprite_path in all_sprites}
+				for entities in encounter.entities.values():
+					all_sprites.update([entity.sprite for entity in entities])
+		sprites = _read_images(list({os.path.basename(x) for x in all_sprites if x is not None}))
 		bin_data = {
 			'level': self,
 			'sprites': sprites,
 		}
 		with open(filename, 'wb') as f:
-			pickle.dump(bin_data, f)
+			pickle.dump(bin_data, f, protocol=pickle.HIGHEST_PROTOCOL)
 	
 	@staticmethod
 	def load_as_scenario(filename: str) -> "Level":
 		with open(filename, 'rb') as f:
 			bin_data = pickle.load(f)
-			sprites = bin_data['sprites']
-			for fpath, sprite in sprites.items():
-				sprite.save(os.path.join(config.temp_dir, fpath))
+			_write_images(bin_data['sprites'])
 			return bin_data['level']
 
 	def __str__(self) -> str:
 		# This is the GLOBAL level description
-		level_description = 'Rooms:\n' + '\n'.join([str(self.rooms[k]) for k in self.rooms.keys()]) + '\n'
-		level_description += 'Corridors:\n' + '\n'.join([str(self.corridors[k]) for k in self.corridors.keys()]) + '\n'
-		level_description += f'Current room: {self.current_room}'
-		return level_description
+		return ''.join(['Rooms:\n', '\n'.join(map(str, self.rooms.values())), '\n',
+		                'Corridors:\n', '\n'.join(map(str, self.corridors.values())), '\n',
+		                f'Current room: {self.current_room}'])
 	
 	def get_corridors_by_room(self, room_name) -> List[Corridor]:
-		return [corridor for corridor in self.corridors.values() if corridor.room_from == room_name or corridor.room_to == room_name]
+		return [self.corridors[corridor_name] for corridor_name in self._room_to_corridors.get(room_name, [])]
+	
+	def count_corridors_by_room(self, room_name) -> int:
+		return len(self._room_to_corridors.get(room_name, []))
+	
+	def get_corridor(self,
+	                 room_from_name: str,
+	                 room_to_name: str,
+	                 ordered: bool = False) -> Optional[Corridor]:
+		corridor = self.corridors.get(self._corridor_pairs.get(_rooms_pair(room_from_name, room_to_name), ''))
+		if corridor is not None and ordered and corridor.room_from != room_from_name:
+			return None
+		return corridor
 	
 	def get_level_subset(self,
 	                     corridor: Corridor,
 	                     opposite_direction: bool = False) -> Tuple[List[Room], List[Corridor]]:
 		# This method assumes that the corridor is NOT part of a loop
 		rooms, corridors = [], []
-		to_expand = [corridor.room_to] if not opposite_direction else [corridor.room_from]
-		while len(to_expand) > 0:
-			for area in to_expand:
-				if area in self.rooms.keys():
-					rooms.append(self.rooms[area])
-					if opposite_direction:
-						to_expand.extend([c.name for c in self.get_corridors_by_room(area) if c.room_from != area and c.name not in corridors])
-					else:
-						to_expand.extend([c.name for c in self.get_corridors_by_room(area) if c.room_to != area and c.name not in corridors])
-				else:
-					corridors.append(self.corridors[area])
-					if self.corridors[area].room_to not in rooms:
-						if opposite_direction:
-							to_expand.append(self.corridors[area].room_from)
-						else:
-							to_expand.append(self.corridors[area].room_to)
-				to_expand.remove(area)
+		visited = set()
+		to_expand = deque([corridor.room_from if opposite_direction else corridor.room_to])
+		while to_expand:
+			area = to_expand.popleft()
+			if area in visited:
+				continue
+			visited.add(area)
+			if area in self.rooms:
+				rooms.append(self.rooms[area])
+				# follow the corridors leaving the room (entering it, if going in the opposite direction)
+				to_expand.extend(c.name for c in self.get_corridors_by_room(area)
+				                 if (c.room_to if opposite_direction else c.room_from) == area)
+			else:
+				c = self.corridors[area]
+				corridors.append(c)
+				to_expand.append(c.room_from if opposite_direction else c.room_to)
 		return rooms, corridors
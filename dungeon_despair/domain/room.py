@@ -1,19 +1,18 @@
 from typing import Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from dungeon_despair.domain.encounter import Encounter
 
 
 class Room(BaseModel):
-	class Config:
-		arbitrary_types_allowed = True
+	model_config = ConfigDict(arbitrary_types_allowed=True)
 
-	name: str = Field(..., description="The name of the room.", required=True)
-	description: str = Field(..., description="The description of the room", required=True)
-	coords: Tuple[int, int] = Field(default=(0, 0), description='The coordinates of the room.', required=True)
-	encounter: Encounter = Field(default=Encounter(), description='The encounter in the room.', required=True)
-	sprite: str = Field(default=None, description='The sprite for the room.', required=False)
+	name: str = Field(..., description="The name of the room.")
+	description: str = Field(..., description="The description of the room")
+	coords: Tuple[int, int] = Field(default=(0, 0), description='The coordinates of the room.')
+	encounter: Encounter = Field(default_factory=Encounter.model_construct, description='The encounter in the room.')
+	sprite: str = Field(default=None, description='The sprite for the room.')
 
 	def __str__(self):
 		return f'{self.name}: {self.description};{self.encounter}'
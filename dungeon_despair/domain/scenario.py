@@ -1,6 +1,7 @@
 from enum import Enum, auto
 
 from dungeon_despair.domain.level import Level
+from dungeon_despair.domain.utils import ENEMY_KEY
 
 
 class ScenarioType(Enum):
@@ -13,17 +14,21 @@ def check_level_playability(level: Level,
                             condition: ScenarioType) -> bool:
 	if condition == ScenarioType.EXPLORE:
 		# Current room must always be a room
-		assert level.current_room in level.rooms.keys(), f'Current room must be a room and not a corridor (currently: {level.current_room}).'
+		if level.current_room not in level.rooms.keys():
+			raise AssertionError(f'Current room must be a room and not a corridor (currently: {level.current_room}).')
 		# Explore mission require at least three rooms
-		assert len(level.rooms) >= 3, f'Explore missions should have at least 3 rooms; found: {len(level.rooms)}.'
+		if len(level.rooms) < 3:
+			raise AssertionError(f'Explore missions should have at least 3 rooms; found: {len(level.rooms)}.')
 		# Check all enemies have at least 1 attack
 		for room in level.rooms.values():
-			for enemy in room.encounter.entities['enemy']:
-				assert len(enemy.attacks) > 0, f'Enemies must all have at least one attack: {enemy.name} in {room.name} has {len(enemy.attacks)} attacks.'
+			for enemy in room.encounter.entities[ENEMY_KEY]:
+				if not enemy.attacks:
+					raise AssertionError(f'Enemies must all have at least one attack: {enemy.name} in {room.name} has 0 attacks.')
 		for corridor in level.corridors.values():
-			for encounter in corridor.encounters:
-				for enemy in encounter.entities['enemy']:
-					assert len(enemy.attacks) > 0, f'Enemies must all have at least one attack: {enemy.name} in {room.name} has {len(enemy.attacks)} attacks.'
+			for i, encounter in enumerate(corridor.encounters):
+				for enemy in encounter.entities[ENEMY_KEY]:
+					if not enemy.attacks:
+						raise AssertionError(f'Enemies must all have at least one attack: {enemy.name} in {corridor.name} in cell {i + 1} has 0 attacks.')
 		# other checks...?
 		
 	elif condition == ScenarioType.TREAURE_HUNT:
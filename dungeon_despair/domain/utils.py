@@ -1,10 +1,13 @@
-from enum import Enum
+import sys
+from collections import deque
+from enum import Enum, StrEnum
+from itertools import product
 from typing import Dict, List, Tuple
 
 from dungeon_despair.domain.configs import config
 
 
-class Direction(Enum):
+class Direction(StrEnum):
 	NORTH = 'north'
 	SOUTH = 'south'
 	EAST = 'east'
@@ -19,6 +22,18 @@ ordered_directions = [
 ]
 
 
+directions_index: Dict[Direction, int] = {direction: i for i, direction in enumerate(ordered_directions)}
+
+
+# unit (x, y) step for each direction
+direction_offsets: Dict[Direction, Tuple[int, int]] = {
+	Direction.NORTH: (0, -1),
+	Direction.SOUTH: (0, 1),
+	Direction.EAST: (1, 0),
+	Direction.WEST: (-1, 0),
+}
+
+
 opposite_direction: Dict[Direction, Direction] = {
 	Direction.NORTH: Direction.SOUTH,
 	Direction.SOUTH: Direction.NORTH,
@@ -26,13 +41,21 @@ opposite_direction: Dict[Direction, Direction] = {
 	Direction.WEST: Direction.EAST,
 }
 
+# copy this rather than rebuilding it when adding a room
+empty_connections: Dict[Direction, str] = {direction: '' for direction in Direction}
 
-class EntityEnum(Enum):
+
+class EntityEnum(StrEnum):
 	ENEMY = 'enemy'
 	TRAP = 'trap'
 	TREASURE = 'treasure'
 
 
+ENEMY_KEY: str = EntityEnum.ENEMY.value
+TRAP_KEY: str = EntityEnum.TRAP.value
+TREASURE_KEY: str = EntityEnum.TREASURE.value
+
+
 entityclass_thresolds: Dict[EntityEnum, int] = {
 	EntityEnum.ENEMY: config.max_enemies_per_encounter,
 	EntityEnum.TRAP: config.max_traps_per_encounter,
@@ -48,11 +71,17 @@ class AttackType(Enum):
 	MOVE = 'move'
 
 
+# every valid starting/target positions string ('XOOO', 'XXOO', ...) -> its interned copy, shared by all attacks
+attack_positions = {positions: sys.intern(positions) for positions in map(''.join, product('XO', repeat=4))}
+
+
 def get_enum_by_value(enum_class,
                       value):
+	if isinstance(value, enum_class):
+		return value
 	try:
-		return enum_class(value)
-	except ValueError:
+		return enum_class._value2member_map_.get(value)
+	except TypeError:  # unhashable value
 		return None
 
 
@@ -61,75 +90,84 @@ def make_corridor_name(room_from_name: str,
 	return f'{room_from_name}-{room_to_name}'
 
 
+def format_location(room_name: str,
+                    cell_index: int) -> str:
+	return room_name if cell_index == -1 else f'{room_name} in cell {cell_index}'
+
+
 def get_encounter(level: "Level",
                   room_name: str,
                   cell_index: int) -> "Encounter":
-	assert room_name in level.rooms.keys() or room_name in level.corridors.keys(), f'{room_name} is not in the level.'
-	if room_name in level.rooms.keys():
-		room = level.rooms[room_name]
+	room = level.rooms.get(room_name)
+	if room is not None:
 		return room.encounter
-	else:
-		corridor = level.corridors[room_name]
-		assert 0 < cell_index <= corridor.length, f'{room_name} is a corridor, but cell_index={cell_index} is invalid, it should be a value between 1 and {corridor.length} (inclusive).'
-		return corridor.encounters[cell_index - 1]
+	corridor = level.corridors.get(room_name)
+	if corridor is None:
+		raise AssertionError(f'{room_name} is not in the level.')
+	if not 0 < cell_index <= corridor.length:
+		raise AssertionError(f'{room_name} is a corridor, but cell_index={cell_index} is invalid, it should be a value between 1 and {corridor.length} (inclusive).')
+	return corridor.encounters[cell_index - 1]
 
 
 def get_new_coords(coords: Tuple[int, int],
                    direction: Direction,
                    n: int) -> Tuple[int, int]:
-	if direction == Direction.SOUTH:
-		return (coords[0], coords[1] + n)
-	elif direction == Direction.NORTH:
-		return (coords[0], coords[1] - n)
-	elif direction == Direction.EAST:
-		return (coords[0] + n, coords[1])
-	elif direction == Direction.WEST:
-		return (coords[0] - n, coords[1])
-	else:
+	try:
+		dx, dy = direction_offsets[direction]
+	except KeyError:
 		raise ValueError(f'Invalid direction {direction}')
+	return coords[0] + dx * n, coords[1] + dy * n
+
+
+def get_corridor_coords(coords: Tuple[int, int],
+                        direction: Direction,
+                        length: int) -> List[Tuple[int, int]]:
+	try:
+		dx, dy = direction_offsets[direction]
+	except KeyError:
+		raise ValueError(f'Invalid direction {direction}')
+	x, y = coords
+	return [(x + dx * n, y + dy * n) for n in range(1, length + 1)]
 
 
 def get_rotation(from_direction: Direction,
                  to_direction: Direction):
-	from_i = ordered_directions.index(from_direction)
-	to_i = ordered_directions.index(to_direction)
-	return to_i - from_i
+	return directions_index[to_direction] - directions_index[from_direction]
 
 
 def get_rotated_direction(direction: Direction,
                           rotate_by: int) -> Direction:
-	return ordered_directions[(ordered_directions.index(direction) + rotate_by) % len(ordered_directions)]
+	return ordered_directions[(directions_index[direction] + rotate_by) % len(ordered_directions)]
 
 
 def check_intersection_coords(coords: Tuple[int, int],
                               level: "Level") -> Tuple[bool, str]:
-	for room_name in level.rooms.keys():
-		if coords == level.rooms[room_name].coords:
-			return True, room_name
-	for corridor_name in level.corridors.keys():
-		if coords in level.corridors[corridor_name].coords:
-			return True, corridor_name
+	area_name = level.get_area_by_coords(coords)
+	return area_name != '', area_name
+
+
+def check_intersection_path(path: List[Tuple[int, int]],
+                            level: "Level") -> Tuple[bool, str]:
+	get_area_by_coords = level.get_area_by_coords
+	for coords in path:
+		area_name = get_area_by_coords(coords)
+		if area_name != '':
+			return True, area_name
 	return False, ''
 
 
 def check_if_in_loop(corridor: "Corridor",
                      connections: Dict[str, Dict[Direction, str]]) -> bool:
 	room_from, room_to = corridor.room_from, corridor.room_to
-	explored_rooms = []
-	paths = [room_to]
-	new_paths = []
-	while len(paths) > 0:
-		for room in paths:
-			explored_rooms.append(room)
-			for direction in Direction:
-				connecting_room = connections[room][direction]
-				if connecting_room != '':
-					if connecting_room == room_from:
-						if room != room_to:
-							return True
-					else:
-						if connecting_room not in explored_rooms:
-							new_paths.append(connecting_room)
-		paths = new_paths
-		new_paths = []
+	explored_rooms = {room_to}
+	paths = deque([room_to])
+	while paths:
+		room = paths.popleft()
+		for connecting_room in connections[room].values():
+			if connecting_room == room_from:
+				if room != room_to:
+					return True
+			elif connecting_room != '' and connecting_room not in explored_rooms:
+				explored_rooms.add(connecting_room)
+				paths.append(connecting_room)
 	return False
@@ -1,5 +1,5 @@
-import copy
 import json
+from typing import Type
 
 from gptfunctionutil import AILibFunction, GPTFunctionLibrary, LibParam, LibParamSpec
 
@@ -8,13 +8,41 @@ from dungeon_despair.domain.configs import config
 from dungeon_despair.domain.corridor import Corridor
 from dungeon_despair.domain.encounter import Encounter
 from dungeon_despair.domain.entities.enemy import Enemy
+from dungeon_despair.domain.entities.entity import Entity
 from dungeon_despair.domain.entities.trap import Trap
 from dungeon_despair.domain.entities.treasure import Treasure
 from dungeon_despair.domain.level import Level
 from dungeon_despair.domain.room import Room
-from dungeon_despair.domain.utils import Direction, get_enum_by_value, opposite_direction, EntityEnum, \
-	make_corridor_name, get_encounter, get_new_coords, check_if_in_loop, \
-	check_intersection_coords, get_rotation, get_rotated_direction, AttackType
+from dungeon_despair.domain.utils import Direction, get_enum_by_value, opposite_direction, empty_connections, EntityEnum, \
+	make_corridor_name, format_location, get_encounter, get_new_coords, get_corridor_coords, check_if_in_loop, \
+	check_intersection_coords, check_intersection_path, get_rotation, get_rotated_direction, AttackType, attack_positions, ENEMY_KEY, TRAP_KEY, TREASURE_KEY
+
+
+def _check_enemy_stats(**stats: float) -> None:
+	for stat, value in stats.items():
+		min_value, max_value = getattr(config, f'min_{stat}'), getattr(config, f'max_{stat}')
+		if not min_value <= value <= max_value:
+			raise AssertionError(f'Invalid {stat} value: {value}; should be between {min_value} and {max_value}.')
+
+
+def _update_entity(encounter: Encounter,
+                   entity_type: EntityEnum,
+                   entity_class: Type[Entity],
+                   reference_name: str,
+                   location: str,
+                   **properties) -> None:
+	if not encounter.has_entity(entity_type, reference_name):
+		raise AssertionError(f'{reference_name} does not exist in {location}.')
+	name = properties['name']
+	if reference_name != name and encounter.has_entity(entity_type, name):
+		raise AssertionError(f'{name} already exists in {location}.')
+	entity = encounter.get_entity_by_name(entity_type, reference_name)
+	# skip updates that would not change anything
+	if any(getattr(entity, k) != v for k, v in properties.items()):
+		if entity_class is Enemy:
+			# attacks are not part of the updatable properties, so keep them
+			properties['attacks'] = entity.attacks
+		encounter.replace_entity(reference_name, entity_type, entity_class(**properties))
 
 
 class DungeonCrawlerFunctions(GPTFunctionLibrary):
@@ -24,13 +52,14 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	                  level: Level) -> str:
 		if isinstance(func_args, str):
 			func_args = json.loads(func_args)
+		else:
+			# do not add the level to the caller's arguments
+			func_args = dict(func_args)
+		func_args['level'] = level
 		try:
 			operation_result = self.call_by_dict({
 				'name': func_name,
-				'arguments': {
-					'level': level,
-					**func_args
-				}
+				'arguments': func_args
 			})
 			return operation_result
 		except AssertionError as e:
@@ -53,71 +82,84 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	                description: str,
 	                room_from: str,
 	                direction: str) -> str:
-		assert name != '', f'Room name should be provided.'
-		assert description != '', f'Room description should be provided.'
-		assert name not in level.rooms.keys(), f'Could not add {name} to the level: {name} already exists.'
+		if name == '':
+			raise AssertionError('Room name should be provided.')
+		if description == '':
+			raise AssertionError('Room description should be provided.')
+		if name in level.rooms.keys():
+			raise AssertionError(f'Could not add {name} to the level: {name} already exists.')
 		if level.current_room == '':
-			assert room_from == '', f'Could not add {name} to the level: room_from must not be set if there is no current room.'
+			if room_from != '':
+				raise AssertionError(f'Could not add {name} to the level: room_from must not be set if there is no current room.')
 		if level.current_room != '':
-			assert room_from != '', f'Could not add {name} to the level: room_from must be set if there exists a current room (current room is {level.current_room}).'
-			assert direction != '', f'Could not add {name} to the level: direction must be set if there exists a current room (current room is {level.current_room}).'
+			if room_from == '':
+				raise AssertionError(f'Could not add {name} to the level: room_from must be set if there exists a current room (current room is {level.current_room}).')
+			if direction == '':
+				raise AssertionError(f'Could not add {name} to the level: direction must be set if there exists a current room (current room is {level.current_room}).')
 		if room_from != '':
-			assert level.current_room not in level.corridors.keys(), f'Could not add {name} to the level: Cannot add a room from a corridor, try adding the room from either the rooms connected by the corridor {level.current_room}.'
-			assert room_from in level.rooms.keys(), f'{room_from} is not a valid room name.'
+			if level.current_room in level.corridors.keys():
+				raise AssertionError(f'Could not add {name} to the level: Cannot add a room from a corridor, try adding the room from either the rooms connected by the corridor {level.current_room}.')
+			if room_from not in level.rooms.keys():
+				raise AssertionError(f'{room_from} is not a valid room name.')
 			dir_enum = get_enum_by_value(Direction, direction)
-			assert dir_enum is not None, f'Could not add {name} to the level: {direction} is not a valid direction.'
-			assert level.connections[room_from][
-				       dir_enum] == '', f'Could not add {name} to the level: {direction} of {room_from} there already exists a room ({level.connections[room_from][dir_enum]}).'
+			if dir_enum is None:
+				raise AssertionError(f'Could not add {name} to the level: {direction} is not a valid direction.')
+			if level.connections[room_from][dir_enum] != '':
+				raise AssertionError(f'Could not add {name} to the level: {direction} of {room_from} there already exists a room ({level.connections[room_from][dir_enum]}).')
 			# try add corridor to connecting room
-			n = len(level.get_corridors_by_room(name)) // 2
+			n = level.count_corridors_by_room(room_from)
 			# can only add corridor if the connecting room has at most 3 corridors already
-			assert n < 4, f'Could not add {name} to the level: {room_from} has too many connections.'
+			if n >= 4:
+				raise AssertionError(f'Could not add {name} to the level: {room_from} has too many connections.')
 			from_coords = level.rooms[room_from].coords
 			new_coords = get_new_coords(coords=from_coords, direction=dir_enum, n=config.corridor_min_length + 1)
 			intersects, intersection_name = check_intersection_coords(coords=new_coords, level=level)
 			if intersects:
 				raise AssertionError(f'Could not add {name} to the level: {name} would clash in {intersection_name}.')
-			corridor_coords = [get_new_coords(coords=from_coords, direction=dir_enum, n=x) for x in range(1, config.corridor_min_length + 1)]
-			for corridor_coord in corridor_coords:
-				intersects, intersection_name = check_intersection_coords(coords=corridor_coord, level=level)
-				if intersects:
-					raise AssertionError(f'Could not add {name} to the level: corridor between {room_from} and {name} would clash in {intersection_name}.')
+			corridor_coords = get_corridor_coords(coords=from_coords, direction=dir_enum, length=config.corridor_min_length)
+			intersects, intersection_name = check_intersection_path(path=corridor_coords, level=level)
+			if intersects:
+				raise AssertionError(f'Could not add {name} to the level: corridor between {room_from} and {name} would clash in {intersection_name}.')
 			# add the new room to the level
-			level.rooms[name] = Room(name=name, description=description, coords=new_coords)
+			level.add_room(Room(name=name, description=description, coords=new_coords))
 			level.current_room = name
 			corridor = Corridor(room_from=room_from, room_to=name, name=f'{room_from}-{name}',
 			                    direction=dir_enum, coords=corridor_coords)
-			level.corridors[corridor.name] = corridor
-			level.connections[name] = {direction: '' for direction in Direction}
+			level.add_corridor(corridor)
+			level.connections[name] = empty_connections.copy()
 			level.connections[room_from][dir_enum] = name
 			level.connections[name][opposite_direction[dir_enum]] = room_from
 			return f'Added {name} to the level.'
 		else:
 			# add the new room to the level
-			level.rooms[name] = Room(name=name, description=description)
+			level.add_room(Room(name=name, description=description))
 			level.current_room = name
-			level.connections[name] = {direction: '' for direction in Direction}
+			level.connections[name] = empty_connections.copy()
 			return f'Added {name} to the level.'
 	
 	@AILibFunction(name='remove_room', description='Remove the room from the level', required=['name'])
 	@LibParam(name='The room name')
 	def remove_room(self, level: Level,
 	                name: str) -> str:
-		assert name in level.rooms.keys(), f'Could not remove {name}: {name} is not in the level.'
-		assert name != '', 'Room name should be provided.'
+		if name not in level.rooms.keys():
+			raise AssertionError(f'Could not remove {name}: {name} is not in the level.')
+		if name == '':
+			raise AssertionError('Room name should be provided.')
 		# remove room
-		del level.rooms[name]
+		level.pop_room(name)
 		del level.connections[name]
 		# remove connections to deleted room
 		to_remove = level.get_corridors_by_room(name)
 		for corridor in to_remove:
-			del level.corridors[corridor.name]
-			# remove connections in "to" rooms
-			for direction in Direction:
-				if corridor.room_to in level.rooms.keys() and level.connections[corridor.room_to][direction] == name:
-					level.connections[corridor.room_to][direction] = ''
-					break
-		level.current_room = list(level.rooms.keys())[0] if len(level.rooms) > 0 else ''
+			level.pop_corridor(corridor.name)
+			# remove connections in the other room
+			if corridor.room_from == name:
+				other_room, direction = corridor.room_to, opposite_direction[corridor.direction]
+			else:
+				other_room, direction = corridor.room_from, corridor.direction
+			if other_room in level.rooms.keys() and level.connections[other_room][direction] == name:
+				level.connections[other_room][direction] = ''
+		level.current_room = next(iter(level.rooms), '')
 		# TODO: Should remove "hanging" rooms as well
 		return f'{name} has been removed from the dungeon.'
 	
@@ -130,20 +172,27 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	                room_reference_name: str,
 	                name: str,
 	                description: str) -> str:
-		assert room_reference_name in level.rooms.keys(), f'Could not update {room_reference_name}: {room_reference_name} is not in the level.'
-		assert room_reference_name != '', 'Parameter room_reference_name should be provided.'
-		assert name != '', 'Room name should be provided.'
-		assert description != '', 'Room description should be provided.'
+		if room_reference_name not in level.rooms.keys():
+			raise AssertionError(f'Could not update {room_reference_name}: {room_reference_name} is not in the level.')
+		if room_reference_name == '':
+			raise AssertionError('Parameter room_reference_name should be provided.')
+		if name == '':
+			raise AssertionError('Room name should be provided.')
+		if description == '':
+			raise AssertionError('Room description should be provided.')
 		if name != room_reference_name:
-			assert name not in level.rooms.keys(), f'Could not update {room_reference_name}: {name} already exists in the level.'
-		# get the current room
-		room = level.rooms[room_reference_name]
-		# remove it from the list of rooms (since room name can change)
-		del level.rooms[room_reference_name]
+			if name in level.rooms.keys():
+				raise AssertionError(f'Could not update {room_reference_name}: {name} already exists in the level.')
+		elif description == level.rooms[room_reference_name].description:
+			# nothing to update
+			return f'Updated {room_reference_name}.'
+		# get the current room and remove it from the list of rooms (since room name can change)
+		room = level.pop_room(room_reference_name)
 		# update the room
 		room.name = name
 		# different description -> sprite must be regenerated
-		if room.description != description:
+		description_changed = room.description != description
+		if description_changed:
 			room.sprite = None
 			# entities in the room may be updated, so reset their sprites as well
 			for k in room.encounter.entities.keys():
@@ -151,30 +200,29 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 					entity.sprite = None
 		# check the corridor(s) as well
 		for corridor in level.get_corridors_by_room(room_reference_name):
-			if corridor.room_from == room_reference_name:
-				del level.corridors[corridor.name]
-				corridor.room_from = room.name
-				corridor.name = f'{room.name}-{corridor.room_to}'
-				corridor.sprites = [None for _ in range(corridor.length)] if room.description != description else corridor.sprites
-				level.corridors[corridor.name] = corridor
-			if corridor.room_to == room_reference_name:
-				del level.corridors[corridor.name]
-				corridor.room_to = room.name
-				corridor.name = f'{corridor.room_from}-{room.name}'
-				corridor.sprites = [None for _ in range(corridor.length)] if room.description != description else corridor.sprites
-				level.corridors[corridor.name] = corridor
+			if description_changed:
+				corridor.sprites = [None] * corridor.length
+			# corridors only need to be renamed (and re-indexed) if the room name changed
+			if name != room_reference_name:
+				level.pop_corridor(corridor.name)
+				if corridor.room_from == room_reference_name:
+					corridor.room_from = room.name
+				if corridor.room_to == room_reference_name:
+					corridor.room_to = room.name
+				corridor.name = make_corridor_name(corridor.room_from, corridor.room_to)
+				level.add_corridor(corridor)
 		room.description = description
 		# add room back
-		level.rooms[name] = room
-		# update level geometry
-		room_connections = level.connections[room_reference_name]
-		del level.connections[room_reference_name]
-		level.connections[name] = room_connections
-		for direction, other_room_name in level.connections[name].items():
-			if other_room_name != '':
-				level.connections[other_room_name][opposite_direction[direction]] = name
-		if level.current_room == room_reference_name:
-			level.current_room = name
+		level.add_room(room)
+		if name != room_reference_name:
+			# update level geometry
+			room_connections = level.connections.pop(room_reference_name)
+			level.connections[name] = room_connections
+			for direction, other_room_name in room_connections.items():
+				if other_room_name != '':
+					level.connections[other_room_name][opposite_direction[direction]] = name
+			if level.current_room == room_reference_name:
+				level.current_room = name
 		return f'Updated {room_reference_name}.'
 
 	
@@ -190,45 +238,55 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	                 room_to_name: str,
 	                 corridor_length: int,
 	                 direction: str) -> str:
-		assert room_from_name != '', f'room_from_name cannot be empty.'
-		assert room_to_name != '', f'room_to_name cannot be empty.'
-		assert room_from_name != room_to_name, f'{room_from_name} cannot be the same as {room_to_name}.'
-		assert room_from_name in level.rooms.keys(), f'Room {room_from_name} is not in the level.'
-		assert room_to_name in level.rooms.keys(), f'Room {room_to_name} is not in the level.'
+		if room_from_name == '':
+			raise AssertionError('room_from_name cannot be empty.')
+		if room_to_name == '':
+			raise AssertionError('room_to_name cannot be empty.')
+		if room_from_name == room_to_name:
+			raise AssertionError(f'{room_from_name} cannot be the same as {room_to_name}.')
+		if room_from_name not in level.rooms.keys():
+			raise AssertionError(f'Room {room_from_name} is not in the level.')
+		if room_to_name not in level.rooms.keys():
+			raise AssertionError(f'Room {room_to_name} is not in the level.')
 		corridor = level.get_corridor(room_from_name, room_to_name, ordered=False)
-		assert corridor is None, f'Could not add corridor: a corridor between {room_from_name} and {room_to_name} already exists.'
-		assert config.corridor_min_length <= corridor_length <= config.corridor_max_length, f'Could not add corridor: corridor_length should be between {config.corridor_min_length} and {config.corridor_max_length}, not {corridor_length}'
+		if corridor is not None:
+			raise AssertionError(f'Could not add corridor: a corridor between {room_from_name} and {room_to_name} already exists.')
+		if not config.corridor_min_length <= corridor_length <= config.corridor_max_length:
+			raise AssertionError(f'Could not add corridor: corridor_length should be between {config.corridor_min_length} and {config.corridor_max_length}, not {corridor_length}')
 		dir_enum = get_enum_by_value(Direction, direction)
-		assert dir_enum is not None, f'Could not add a corridor: {direction} is not a valid direction.'
-		assert level.connections[room_from_name][
-			       dir_enum] == '', f'Could not add corridor: {direction} of {room_from_name} already has a corridor to {level.connections[room_from_name][dir_enum]}.'
-		n = (len(level.get_corridors_by_room(room_from_name)) // 2,
-		     len(level.get_corridors_by_room(room_to_name)) // 2)  # number of corridors for each room
+		if dir_enum is None:
+			raise AssertionError(f'Could not add a corridor: {direction} is not a valid direction.')
+		if level.connections[room_from_name][dir_enum] != '':
+			raise AssertionError(f'Could not add corridor: {direction} of {room_from_name} already has a corridor to {level.connections[room_from_name][dir_enum]}.')
+		n = (level.count_corridors_by_room(room_from_name),
+		     level.count_corridors_by_room(room_to_name))  # number of corridors for each room
 		# only add corridor if each room has at most 3 corridors
-		assert n[0] < 4, f'Could not add corridor: {room_from_name} has already 4 connections.'
-		assert n[1] < 4, f'Could not add corridor: {room_to_name} has already 4 connections.'
+		if n[0] >= 4:
+			raise AssertionError(f'Could not add corridor: {room_from_name} has already 4 connections.')
+		if n[1] >= 4:
+			raise AssertionError(f'Could not add corridor: {room_to_name} has already 4 connections.')
 		# Check if the rooms are reachable with the specified corridor
 		from_coords = level.rooms[room_from_name].coords
 		to_coords = level.rooms[room_to_name].coords
 		hyp_to_coords = get_new_coords(coords=from_coords, direction=dir_enum, n=corridor_length + 1)
-		assert to_coords == hyp_to_coords, f'Could not add corridor: cannot reach {room_to_name} from {room_from_name} with a corridor of length {corridor_length} along {direction}.'
+		if to_coords != hyp_to_coords:
+			raise AssertionError(f'Could not add corridor: cannot reach {room_to_name} from {room_from_name} with a corridor of length {corridor_length} along {direction}.')
 		# Check if the corridor doesn't intersect other rooms/corridors
-		corridor_coords = [get_new_coords(coords=from_coords, direction=dir_enum, n=x) for x in range(1, corridor_length + 1)]
-		for corridor_coord in corridor_coords:
-			intersects, intersection_name = check_intersection_coords(coords=corridor_coord, level=level)
-			if intersects:
-				raise AssertionError(
-					f'Could not add corridor between {room_from_name} and {room_to_name} to the level: it would clash in {intersection_name}.')
+		corridor_coords = get_corridor_coords(coords=from_coords, direction=dir_enum, length=corridor_length)
+		intersects, intersection_name = check_intersection_path(path=corridor_coords, level=level)
+		if intersects:
+			raise AssertionError(
+				f'Could not add corridor between {room_from_name} and {room_to_name} to the level: it would clash in {intersection_name}.')
 		# Update level and add the corridor
 		level.connections[room_from_name][dir_enum] = room_to_name
 		level.connections[room_to_name][opposite_direction[dir_enum]] = room_from_name
 		corridor = Corridor(room_from=room_from_name, room_to=room_to_name,
 		                    name=make_corridor_name(room_from_name, room_to_name),
 		                    length=corridor_length,
-		                    encounters=[Encounter() for _ in range(corridor_length)],
+		                    encounters=[Encounter.model_construct() for _ in range(corridor_length)],
 		                    direction=dir_enum,
 		                    coords=corridor_coords)
-		level.corridors[corridor.name] = corridor
+		level.add_corridor(corridor)
 		level.current_room = f'{room_from_name}-{room_to_name}'
 		return f'Added corridor between {room_from_name} and {room_to_name}.'
 	
@@ -239,18 +297,18 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	def remove_corridor(self, level: Level,
 	                    room_from_name: str,
 	                    room_to_name: str) -> str:
-		assert room_from_name != '', f'room_from_name cannot be empty.'
-		assert room_to_name != '', f'room_to_name cannot be empty.'
+		if room_from_name == '':
+			raise AssertionError('room_from_name cannot be empty.')
+		if room_to_name == '':
+			raise AssertionError('room_to_name cannot be empty.')
 		corridor = level.get_corridor(room_from_name, room_to_name, ordered=False)
-		assert corridor is not None, f'Corridor between {room_from_name} and {room_to_name} does not exist.'
+		if corridor is None:
+			raise AssertionError(f'Corridor between {room_from_name} and {room_to_name} does not exist.')
 		# remove the corridor from the level
-		del level.corridors[corridor.name]
+		level.pop_corridor(corridor.name)
 		# remove connection between the two rooms
-		for room_a, room_b in [(room_from_name, room_to_name), (room_to_name, room_from_name)]:
-			for direction in Direction:
-				if level.connections[room_a][direction] == room_b:
-					level.connections[room_a][direction] = ''
-					break
+		level.connections[corridor.room_from][corridor.direction] = ''
+		level.connections[corridor.room_to][opposite_direction[corridor.direction]] = ''
 		# update the current room if necessary
 		if level.current_room == corridor.name:
 			level.current_room = corridor.room_from
@@ -270,94 +328,76 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	                    room_to_name: str,
 	                    corridor_length: int,
 	                    direction: str) -> str:
-		assert room_from_name != '', f'room_from_name cannot be empty.'
-		assert room_to_name != '', f'room_to_name cannot be empty.'
-		assert config.corridor_min_length <= corridor_length <= config.corridor_max_length, f'Could not add corridor: corridor_length should be between {config.corridor_min_length} and {config.corridor_max_length}, not {corridor_length}'
+		if room_from_name == '':
+			raise AssertionError('room_from_name cannot be empty.')
+		if room_to_name == '':
+			raise AssertionError('room_to_name cannot be empty.')
+		if not config.corridor_min_length <= corridor_length <= config.corridor_max_length:
+			raise AssertionError(f'Could not add corridor: corridor_length should be between {config.corridor_min_length} and {config.corridor_max_length}, not {corridor_length}')
 		corridor = level.get_corridor(room_from_name, room_to_name, ordered=False)
-		assert corridor is not None, f'Corridor between {room_from_name} and {room_to_name} does not exist.'
+		if corridor is None:
+			raise AssertionError(f'Corridor between {room_from_name} and {room_to_name} does not exist.')
 		dir_enum = get_enum_by_value(Direction, direction)
-		assert dir_enum is not None, f'Could not update corridor between {room_from_name} and {room_to_name}: {direction} is not a valid direction.'
+		if dir_enum is None:
+			raise AssertionError(f'Could not update corridor between {room_from_name} and {room_to_name}: {direction} is not a valid direction.')
+		if dir_enum != corridor.direction and level.connections[corridor.room_from][dir_enum] != '':
+			raise AssertionError(f'Could not update corridor between {room_from_name} and {room_to_name}: {direction} of {corridor.room_from} there already exists a room ({level.connections[corridor.room_from][dir_enum]}).')
 		# corridors cannot be changed if in a loop
-		assert not check_if_in_loop(corridor=corridor,
-		                            connections=level.connections), 'Could not update corridor: corridors in a closed loop cannot be altered.'
-		# Make a copy of parts of the level that would change and that would be fixed
+		if check_if_in_loop(corridor=corridor, connections=level.connections):
+			raise AssertionError('Could not update corridor: corridors in a closed loop cannot be altered.')
+		# Make a copy of parts of the level that would change
 		changing_rooms, changing_corridors = level.get_level_subset(corridor=corridor, opposite_direction=False)
-		fixed_rooms, fixed_corridors = level.get_level_subset(corridor=corridor, opposite_direction=True)
 		changing_corridors.insert(0, corridor)  # first element since changes are cascaded
-		changing_rooms = {x.name: copy.deepcopy(x) for x in changing_rooms}
-		changing_corridors = {x.name: copy.deepcopy(x) for x in changing_corridors}
-		fixed_rooms = {x.name: copy.deepcopy(x) for x in fixed_rooms}
-		fixed_corridors = {x.name: copy.deepcopy(x) for x in fixed_corridors}
-		# Apply rotations first
-		curr_dir_enum = get_enum_by_value(Direction, corridor.direction)
-		if dir_enum != curr_dir_enum:
-			rotated = []
-			rotate_by = get_rotation(from_direction=curr_dir_enum, to_direction=dir_enum)
-			for c in changing_corridors.values():
-				if c.name not in rotated:
-					c.direction = get_rotated_direction(direction=curr_dir_enum, rotate_by=rotate_by)
-					# room_from may be in fixed_rooms
-					if c.room_from in fixed_rooms.keys():
-						from_coords = fixed_rooms[c.room_from].coords
-					else:
-						from_coords = changing_rooms[c.room_from].coords
-					c.coords = [get_new_coords(coords=from_coords,
-					                           direction=dir_enum,
-					                           n=x) for x in range(1, c.length + 1)]
-					# update the coordinates of the room_to
-					changing_rooms[c.room_to].coords = get_new_coords(coords=c.coords[-1],
-					                                                  direction=dir_enum,
-					                                                  n=1)
-					rotated.append(c.name)
-		# Apply corridor length change
-		if corridor_length != corridor.length:
-			updated = []
-			changing_corridors[corridor.name].length = corridor_length
-			for c in changing_corridors.values():
-				if c.name not in updated:
-					if c.room_from in fixed_rooms.keys():
-						from_coords = fixed_rooms[c.room_from].coords
-					else:
-						from_coords = changing_rooms[c.room_from].coords
-					c.coords = [get_new_coords(coords=from_coords,
-					                           direction=c.direction,
-					                           n=x) for x in range(1, c.length + 1)]
-					changing_rooms[c.room_to].coords = get_new_coords(coords=c.coords[-1],
-					                                                  direction=c.direction,
-					                                                  n=1)
-					updated.append(c.name)
-		# Check for intersections with the fixed part of the level
+		# only coords, direction and length are reassigned, so shallow copies are enough
+		changing_rooms = {x.name: x.model_copy() for x in changing_rooms}
+		changing_corridors = {x.name: x.model_copy() for x in changing_corridors}
+		# Apply rotation and length change in a single pass (changes are cascaded)
+		rotate_by = get_rotation(from_direction=corridor.direction, to_direction=dir_enum)
+		changing_corridors[corridor.name].length = corridor_length
+		for c in changing_corridors.values():
+			if rotate_by != 0:
+				c.direction = get_rotated_direction(direction=c.direction, rotate_by=rotate_by)
+			# room_from may be in the fixed part of the level
+			if c.room_from in changing_rooms:
+				from_coords = changing_rooms[c.room_from].coords
+			else:
+				from_coords = level.rooms[c.room_from].coords
+			c.coords = get_corridor_coords(coords=from_coords,
+			                               direction=c.direction,
+			                               length=c.length)
+			# update the coordinates of the room_to
+			changing_rooms[c.room_to].coords = get_new_coords(coords=c.coords[-1],
+			                                                  direction=c.direction,
+			                                                  n=1)
+		# Check for intersections with the rest of the level (areas being moved do not count)
+		changing_areas = changing_rooms.keys() | changing_corridors.keys()
 		for changing_room in changing_rooms.values():
-			for fixed_room in fixed_rooms.values():
-				if changing_room.coords == fixed_room.coords:
-					raise AssertionError(f'Could not update corridor between {room_from_name} and {room_to_name}: updated corridor would results in {changing_room.name} intersect with {fixed_room.name}')
-			for fixed_corridor in fixed_corridors.values():
-				if changing_room.coords in fixed_corridor.coords:
-					raise AssertionError(
-						f'Could not update corridor between {room_from_name} and {room_to_name}: updated corridor would results in {changing_room.name} intersect with {fixed_corridor.name}')
+			area_name = level.get_area_by_coords(changing_room.coords)
+			if area_name != '' and area_name not in changing_areas:
+				raise AssertionError(
+					f'Could not update corridor between {room_from_name} and {room_to_name}: updated corridor would results in {changing_room.name} intersect with {area_name}')
 		for changing_corridor in changing_corridors.values():
-			for fixed_room in fixed_rooms.values():
-				if fixed_room.coords in changing_corridor.coords:
-					raise AssertionError(
-						f'Could not update corridor between {room_from_name} and {room_to_name}: updated corridor would results in {changing_corridor.name} intersect with {fixed_room.name}')
-			for fixed_corridor in fixed_corridors.values():
-				if len(set(changing_corridor.coords).difference(fixed_corridor.coords)) > 0:
+			for coords in changing_corridor.coords:
+				area_name = level.get_area_by_coords(coords)
+				if area_name != '' and area_name not in changing_areas:
 					raise AssertionError(
-						f'Could not update corridor between {room_from_name} and {room_to_name}: updated corridor would results in {changing_corridor.name} intersect with {fixed_corridor.name}')
+						f'Could not update corridor between {room_from_name} and {room_to_name}: updated corridor would results in {changing_corridor.name} intersect with {area_name}')
 		# If everything is fine, update the level (and the connections)
-		# remove old connection
-		level.connections[corridor.room_from][get_enum_by_value(Direction, corridor.direction)] = ''
-		level.connections[corridor.room_to][opposite_direction[get_enum_by_value(Direction, corridor.direction)]] = ''
+		# remove old connections
+		for changing_corridor in changing_corridors.values():
+			old_corridor = level.corridors[changing_corridor.name]
+			level.connections[old_corridor.room_from][old_corridor.direction] = ''
+			level.connections[old_corridor.room_to][opposite_direction[old_corridor.direction]] = ''
 		# update rooms
-		for room_name in changing_rooms.keys():
-			level.rooms[room_name] = changing_rooms[room_name]
+		for changing_room in changing_rooms.values():
+			level.add_room(changing_room)
 		# update corridors
-		for corridor_name in changing_corridors.keys():
-			level.corridors[corridor_name] = changing_corridors[corridor_name]
+		for changing_corridor in changing_corridors.values():
+			level.add_corridor(changing_corridor)
 		# update connections
 		for changing_corridor in changing_corridors.values():
-			level.connections[changing_corridor.room_from][get_enum_by_value(Direction, changing_corridor.direction)] = changing_corridor.room_to
-			level.connections[changing_corridor.room_to][opposite_direction[get_enum_by_value(Direction, changing_corridor.direction)]] = changing_corridor.room_from
+			level.connections[changing_corridor.room_from][changing_corridor.direction] = changing_corridor.room_to
+			level.connections[changing_corridor.room_to][opposite_direction[changing_corridor.direction]] = changing_corridor.room_from
 		# Get the updated corridor
 		corridor = level.corridors[corridor.name]
 		# Update encounters and sprites if the length of the corridor has changed
@@ -365,15 +405,16 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 			if len(corridor.encounters) > corridor.length:
 				# Drop extra encounters
 				corridor.encounters = corridor.encounters[:corridor.length]
-				# Drop extra sprites
-				last_sprite = corridor.sprites[-1]  # Last sprite is kept
-				corridor.sprites = corridor.sprites[0:corridor.length + 1] + [last_sprite]
+				# Drop extra sprites (if any have been generated yet)
+				if corridor.sprites:
+					last_sprite = corridor.sprites[-1]  # Last sprite is kept
+					corridor.sprites = corridor.sprites[0:corridor.length + 1] + [last_sprite]
 			else:
-				while len(corridor.encounters) < corridor.length:
-					# Add new, empty encounters
-					corridor.encounters.append(Encounter())
-					# Add empty sprite
-					corridor.sprites.insert(-2, None)
+				n_new = corridor.length - len(corridor.encounters)
+				# Add new, empty encounters
+				corridor.encounters.extend(Encounter.model_construct() for _ in range(n_new))
+				# Add empty sprites
+				corridor.sprites[-2:-2] = [None] * n_new
 		level.current_room = corridor.name
 		return f'Updated corridor between {room_from_name} and {room_to_name}.'
 	
@@ -404,22 +445,22 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	              prot: float,
 	              spd: float,
 	              cell_index: int) -> str:
-		assert room_name != '', 'Parameter room_name should be provided.'
-		assert name != '', 'Enemy name should be provided.'
-		assert description != '', 'Enemy description should be provided.'
-		assert config.min_hp <= hp <= config.max_hp, f'Invalid hp value: {hp}; should be between {config.min_hp} and  {config.max_hp}.'
-		assert config.min_dodge <= dodge <= config.max_dodge, f'Invalid dodge value: {dodge}; should be between {config.min_dodge} and  {config.max_dodge}.'
-		assert config.min_prot <= prot <= config.max_prot, f'Invalid prot value: {prot}; should be between {config.min_prot} and  {config.max_prot}.'
-		assert config.min_spd <= spd <= config.max_spd, f'Invalid spd value: {spd}; should be between {config.min_spd} and  {config.max_spd}.'
+		if room_name == '':
+			raise AssertionError('Parameter room_name should be provided.')
+		if name == '':
+			raise AssertionError('Enemy name should be provided.')
+		if description == '':
+			raise AssertionError('Enemy description should be provided.')
+		_check_enemy_stats(hp=hp, dodge=dodge, prot=prot, spd=spd)
 		encounter = get_encounter(level, room_name, cell_index)
-		assert name not in [enemy.name for enemy in encounter.entities[
-			EntityEnum.ENEMY.value]], f'Could not add enemy: {name} already exists in {room_name}{" in cell " + str(cell_index) if cell_index != -1 else ""}.'
-		assert len(encounter.entities.get(EntityEnum.ENEMY.value,
-		                                  [])) < config.max_enemies_per_encounter, f'Could not add enemy: there are already {config.max_enemies_per_encounter} enemy(es) in {room_name}{" in cell " + str(cell_index) if cell_index != -1 else ""}, which is the maximum number allowed.'
+		if encounter.has_entity(EntityEnum.ENEMY, name):
+			raise AssertionError(f'Could not add enemy: {name} already exists in {format_location(room_name, cell_index)}.')
+		if len(encounter.entities[ENEMY_KEY]) >= config.max_enemies_per_encounter:
+			raise AssertionError(f'Could not add enemy: there are already {config.max_enemies_per_encounter} enemy(es) in {format_location(room_name, cell_index)}, which is the maximum number allowed.')
 		enemy = Enemy(name=name, description=description, species=species, hp=hp, dodge=dodge, prot=prot, spd=spd)
 		encounter.add_entity(EntityEnum.ENEMY, enemy)
 		level.current_room = room_name
-		return f'Added {name} to {room_name}{" in cell " + str(cell_index) if cell_index != -1 else ""}.'
+		return f'Added {name} to {format_location(room_name, cell_index)}.'
 	
 	
 	@AILibFunction(name='add_treasure', description='Add a treasure to a room or corridor',
@@ -436,19 +477,23 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	                 description: str,
 	                 loot: str,
 	                 cell_index: int) -> str:
-		assert room_name != '', 'Parameter room_name should be provided.'
-		assert name != '', 'Treasure name should be provided.'
-		assert description != '', 'Treasure description should be provided.'
-		assert loot != '', 'Treasure loot should be provided.'
+		if room_name == '':
+			raise AssertionError('Parameter room_name should be provided.')
+		if name == '':
+			raise AssertionError('Treasure name should be provided.')
+		if description == '':
+			raise AssertionError('Treasure description should be provided.')
+		if loot == '':
+			raise AssertionError('Treasure loot should be provided.')
 		encounter = get_encounter(level, room_name, cell_index)
-		assert name not in [treasure.name for treasure in encounter.entities[
-			EntityEnum.TREASURE.value]], f'Could not add treasure: {name} already exists in {room_name}{" in cell " + str(cell_index) if cell_index != -1 else ""}.'
-		assert 0 <= len(encounter.entities.get(EntityEnum.TREASURE.value,
-		                                      [])) < config.max_treasures_per_encounter, f'Could not add treasure: there is already {config.max_treasures_per_encounter} treasure(s) in {room_name}{" in cell " + str(cell_index) if cell_index != -1 else ""}, which is the maximum number allowed..'
+		if encounter.has_entity(EntityEnum.TREASURE, name):
+			raise AssertionError(f'Could not add treasure: {name} already exists in {format_location(room_name, cell_index)}.')
+		if len(encounter.entities[TREASURE_KEY]) >= config.max_treasures_per_encounter:
+			raise AssertionError(f'Could not add treasure: there is already {config.max_treasures_per_encounter} treasure(s) in {format_location(room_name, cell_index)}, which is the maximum number allowed.')
 		treasure = Treasure(name=name, description=description, loot=loot)
 		encounter.add_entity(EntityEnum.TREASURE, treasure)
 		level.current_room = room_name
-		return f'Added {name} to {room_name}{" in cell " + str(cell_index) if cell_index != -1 else ""}.'
+		return f'Added {name} to {format_location(room_name, cell_index)}.'
 	
 	
 	@AILibFunction(name='add_trap',
@@ -465,19 +510,24 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	             description: str,
 	             effect: str,
 	             cell_index: int) -> str:
-		assert corridor_name != '', 'Parameter corridor_name should be provided.'
-		assert name != '', 'Trap name should be provided.'
-		assert description != '', 'Trap description should be provided.'
-		assert effect != '', 'Trap effect should be provided.'
-		assert corridor_name in level.corridors.keys(), f'Traps can only be added only to corridors, but {corridor_name} seems to be a room.'
-		corridor = level.corridors[corridor_name]
-		assert corridor is not None, f'Corridor {corridor_name} does not exist.'
-		assert 0 < cell_index <= corridor.length, f'{corridor_name} is a corridor, but cell_index={cell_index} is invalid, it should be a value between 1 and {corridor.length} (inclusive).'
+		if corridor_name == '':
+			raise AssertionError('Parameter corridor_name should be provided.')
+		if name == '':
+			raise AssertionError('Trap name should be provided.')
+		if description == '':
+			raise AssertionError('Trap description should be provided.')
+		if effect == '':
+			raise AssertionError('Trap effect should be provided.')
+		corridor = level.corridors.get(corridor_name)
+		if corridor is None:
+			raise AssertionError(f'Traps can only be added only to corridors, but {corridor_name} seems to be a room.')
+		if not 0 < cell_index <= corridor.length:
+			raise AssertionError(f'{corridor_name} is a corridor, but cell_index={cell_index} is invalid, it should be a value between 1 and {corridor.length} (inclusive).')
 		encounter = corridor.encounters[cell_index - 1]
-		assert name not in [trap.name for trap in encounter.entities[
-			EntityEnum.TRAP.value]], f'Could not add trap: {name} already exists in {corridor_name} in cell {cell_index}.'
-		assert 0 <= len(encounter.entities.get(EntityEnum.TRAP.value,
-		                                      [])) < config.max_traps_per_encounter, f'Could not add trap: there is already {config.max_traps_per_encounter} trap(s) in {corridor_name} in cell {cell_index}.'
+		if encounter.has_entity(EntityEnum.TRAP, name):
+			raise AssertionError(f'Could not add trap: {name} already exists in {corridor_name} in cell {cell_index}.')
+		if len(encounter.entities[TRAP_KEY]) >= config.max_traps_per_encounter:
+			raise AssertionError(f'Could not add trap: there is already {config.max_traps_per_encounter} trap(s) in {corridor_name} in cell {cell_index}.')
 		trap = Trap(name=name, description=description, effect=effect)
 		encounter.add_entity(EntityEnum.TRAP, trap)
 		level.current_room = corridor_name
@@ -514,23 +564,20 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	                            prot: float,
 	                            spd: float,
 	                            cell_index: int) -> str:
-		assert room_name != '', 'Parameter room_name should be provided.'
-		assert reference_name != '', 'Enemy reference name should be provided.'
-		assert name != '', 'Enemy name should be provided.'
-		assert description != '', 'Enemy description should be provided.'
-		assert species != '', 'Enemy species should be provided.'
-		assert config.min_hp <= hp <= config.max_hp, f'Invalid hp value: {hp}; should be between {config.min_hp} and {config.max_hp}.'
-		assert config.min_dodge <= dodge <= config.max_dodge, f'Invalid dodge value: {dodge}; should be between {config.min_dodge} and {config.max_dodge}.'
-		assert config.min_prot <= prot <= config.max_prot, f'Invalid prot value: {prot}; should be between {config.min_prot} and {config.max_prot}.'
-		assert config.min_spd <= spd <= config.max_spd, f'Invalid spd value: {spd}; should be between {config.min_spd} and {config.max_spd}.'
-		encounter = get_encounter(level, room_name, cell_index)
-		assert reference_name in [enemy.name for enemy in encounter.entities[
-			EntityEnum.ENEMY.value]], f'{reference_name} does not exist in {room_name}{" in cell " + str(cell_index) if cell_index != -1 else ""}.'
-		assert (reference_name == name) or (name not in [enemy.name for enemy in encounter.entities[
-			EntityEnum.ENEMY.value]]), f'{name} already exists in {room_name}{" in cell " + str(cell_index) if cell_index != -1 else ""}.'
-		updated_enemy = Enemy(name=name, description=description, species=species,
-		                      hp=hp, dodge=dodge, prot=prot, spd=spd)
-		encounter.replace_entity(reference_name, EntityEnum.ENEMY, updated_enemy)
+		if room_name == '':
+			raise AssertionError('Parameter room_name should be provided.')
+		if reference_name == '':
+			raise AssertionError('Enemy reference name should be provided.')
+		if name == '':
+			raise AssertionError('Enemy name should be provided.')
+		if description == '':
+			raise AssertionError('Enemy description should be provided.')
+		if species == '':
+			raise AssertionError('Enemy species should be provided.')
+		_check_enemy_stats(hp=hp, dodge=dodge, prot=prot, spd=spd)
+		_update_entity(get_encounter(level, room_name, cell_index), EntityEnum.ENEMY, Enemy,
+		               reference_name, format_location(room_name, cell_index),
+		               name=name, description=description, species=species, hp=hp, dodge=dodge, prot=prot, spd=spd)
 		level.current_room = room_name
 		return f'Updated {reference_name} properties in {room_name}.'
 	
@@ -552,18 +599,19 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	                               description: str,
 	                               loot: str,
 	                               cell_index: int) -> str:
-		assert room_name != '', 'Parameter room_name should be provided.'
-		assert reference_name != '', 'Treasure reference name should be provided.'
-		assert name != '', 'Treasure name should be provided.'
-		assert description != '', 'Treasure description should be provided.'
-		assert loot != '', 'Treasure loot should be provided.'
-		encounter = get_encounter(level, room_name, cell_index)
-		assert reference_name in [treasure.name for treasure in encounter.entities[
-			EntityEnum.TREASURE.value]], f'{reference_name} does not exist in {room_name}{" in cell " + str(cell_index) if cell_index != -1 else ""}.'
-		assert (reference_name == name) or (name not in [treasure.name for treasure in encounter.entities[
-			EntityEnum.TREASURE.value]]), f'{name} already exists in {room_name}{" in cell " + str(cell_index) if cell_index != -1 else ""}.'
-		updated_treasure = Treasure(name=name, description=description, loot=loot)
-		encounter.replace_entity(reference_name, EntityEnum.TREASURE, updated_treasure)
+		if room_name == '':
+			raise AssertionError('Parameter room_name should be provided.')
+		if reference_name == '':
+			raise AssertionError('Treasure reference name should be provided.')
+		if name == '':
+			raise AssertionError('Treasure name should be provided.')
+		if description == '':
+			raise AssertionError('Treasure description should be provided.')
+		if loot == '':
+			raise AssertionError('Treasure loot should be provided.')
+		_update_entity(get_encounter(level, room_name, cell_index), EntityEnum.TREASURE, Treasure,
+		               reference_name, format_location(room_name, cell_index),
+		               name=name, description=description, loot=loot)
 		level.current_room = room_name
 		return f'Updated {reference_name} properties in {room_name}.'
 	
@@ -585,21 +633,24 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	                           description: str,
 	                           effect: str,
 	                           cell_index: int = None) -> str:
-		assert corridor_name != '', 'Parameter corridor_name should be provided.'
-		assert reference_name != '', 'Trap reference name should be provided.'
-		assert name != '', 'Trap name should be provided.'
-		assert description != '', 'Trap description should be provided.'
-		assert effect != '', 'Trap effect should be provided.'
-		corridor = level.corridors[corridor_name]
-		assert corridor is not None, f'Corridor {corridor_name} does not exist.'
-		assert 0 < cell_index <= corridor.length, f'{corridor_name} is a corridor, but cell_index={cell_index} is invalid, it should be a value between 1 and {corridor.length} (inclusive).'
-		encounter = corridor.encounters[cell_index - 1]
-		assert reference_name in [trap.name for trap in encounter.entities[
-			EntityEnum.TRAP.value]], f'{reference_name} does not exist in {corridor_name} in cell {cell_index}.'
-		assert (reference_name == name) or (name not in [trap.name for trap in encounter.entities[
-			EntityEnum.TRAP.value]]), f'{name} already exists in {corridor_name} in cell {cell_index}.'
-		updated_trap = Trap(name=name, description=description, effect=effect)
-		encounter.replace_entity(reference_name, EntityEnum.TRAP, updated_trap)
+		if corridor_name == '':
+			raise AssertionError('Parameter corridor_name should be provided.')
+		if reference_name == '':
+			raise AssertionError('Trap reference name should be provided.')
+		if name == '':
+			raise AssertionError('Trap name should be provided.')
+		if description == '':
+			raise AssertionError('Trap description should be provided.')
+		if effect == '':
+			raise AssertionError('Trap effect should be provided.')
+		corridor = level.corridors.get(corridor_name)
+		if corridor is None:
+			raise AssertionError(f'Corridor {corridor_name} does not exist.')
+		if not 0 < cell_index <= corridor.length:
+			raise AssertionError(f'{corridor_name} is a corridor, but cell_index={cell_index} is invalid, it should be a value between 1 and {corridor.length} (inclusive).')
+		_update_entity(corridor.encounters[cell_index - 1], EntityEnum.TRAP, Trap,
+		               reference_name, format_location(corridor_name, cell_index),
+		               name=name, description=description, effect=effect)
 		level.current_room = corridor_name
 		return f'Updated {reference_name} properties in {corridor_name}.'
 	
@@ -617,14 +668,18 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	                  entity_name: str,
 	                  entity_type: str,
 	                  cell_index: int) -> str:
-		assert room_name != '', 'Parameter room_name should be provided.'
-		assert entity_name != '', 'Entity name should be provided.'
-		assert entity_type != '', 'Entity type should be provided.'
+		if room_name == '':
+			raise AssertionError('Parameter room_name should be provided.')
+		if entity_name == '':
+			raise AssertionError('Entity name should be provided.')
+		if entity_type == '':
+			raise AssertionError('Entity type should be provided.')
 		entity_enum = get_enum_by_value(EntityEnum, entity_type)
-		assert entity_enum is not None, f'Invalid entity type: {entity_type}.'
+		if entity_enum is None:
+			raise AssertionError(f'Invalid entity type: {entity_type}.')
 		encounter = get_encounter(level, room_name, cell_index)
-		assert entity_name in [entity.name for entity in encounter.entities[
-			entity_enum.value]], f'{entity_name} does not exist in {room_name}{" in cell " + str(cell_index) if cell_index != -1 else ""}.'
+		if not encounter.has_entity(entity_enum, entity_name):
+			raise AssertionError(f'{entity_name} does not exist in {format_location(room_name, cell_index)}.')
 		encounter.remove_entity_by_name(entity_enum, entity_name)
 		level.current_room = room_name
 		return f'Removed {entity_name} from {room_name}.'
@@ -658,30 +713,40 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	               target_positions: str,
 	               base_dmg: float,
 	               accuracy: float) -> str:
-		assert room_name != '', f'Parameter room_name should be provided.'
-		assert name != '', f'Attack name should be specified.'
-		assert description != '', f'Attack description should be specified.'
-		assert enemy_name != '', f'Enemy name should be specified.'
+		if room_name == '':
+			raise AssertionError('Parameter room_name should be provided.')
+		if name == '':
+			raise AssertionError('Attack name should be specified.')
+		if description == '':
+			raise AssertionError('Attack description should be specified.')
+		if enemy_name == '':
+			raise AssertionError('Enemy name should be specified.')
 		type_enum = get_enum_by_value(AttackType, attack_type)
-		assert type_enum is not None, f'Attack type "{attack_type}" is not a valid type: it must be one of {", ".join([t.value for t in AttackType])}.'
+		if type_enum is None:
+			raise AssertionError(f'Attack type "{attack_type}" is not a valid type: it must be one of {", ".join([t.value for t in AttackType])}.')
 		if type_enum == AttackType.DAMAGE:
-			assert config.min_base_dmg <= base_dmg <= config.max_base_dmg, f'Invalid base_dmg value: {base_dmg}; should be between {config.min_base_dmg} and {config.max_base_dmg}.'
+			if not config.min_base_dmg <= base_dmg <= config.max_base_dmg:
+				raise AssertionError(f'Invalid base_dmg value: {base_dmg}; should be between {config.min_base_dmg} and {config.max_base_dmg}.')
 		else:  # type is HEAL
-			assert -config.max_base_dmg <= base_dmg <= -config.min_base_dmg, f'Invalid base_dmg value: {base_dmg}; should be between {-config.max_base_dmg} and {-config.min_base_dmg}.'
-		assert 0.0 <= accuracy <= 1.0, f'Invalid accuracy: must be between 0.0 and 1.0'
-		assert len(
-			starting_positions) == 4, f'Invalid starting_positions value: {starting_positions}. Must be 4 characters long.'
-		assert len(
-			target_positions) == 4, f'Invalid target_positions value: {target_positions}. Must be 4 characters long.'
-		assert set(starting_positions).issubset({'X', 'O'}), f'Invalid starting_positions value: {starting_positions}. Must contain only "X" and "O" characters.'
-		assert set(target_positions).issubset({'X', 'O'}), f'Invalid target_positions value: {target_positions}. Must contain only "X" and "O" characters.'
+			if not -config.max_base_dmg <= base_dmg <= -config.min_base_dmg:
+				raise AssertionError(f'Invalid base_dmg value: {base_dmg}; should be between {-config.max_base_dmg} and {-config.min_base_dmg}.')
+		if not 0.0 <= accuracy <= 1.0:
+			raise AssertionError('Invalid accuracy: must be between 0.0 and 1.0')
+		if len(starting_positions) != 4:
+			raise AssertionError(f'Invalid starting_positions value: {starting_positions}. Must be 4 characters long.')
+		if len(target_positions) != 4:
+			raise AssertionError(f'Invalid target_positions value: {target_positions}. Must be 4 characters long.')
+		if starting_positions not in attack_positions:
+			raise AssertionError(f'Invalid starting_positions value: {starting_positions}. Must contain only "X" and "O" characters.')
+		if target_positions not in attack_positions:
+			raise AssertionError(f'Invalid target_positions value: {target_positions}. Must contain only "X" and "O" characters.')
+		starting_positions, target_positions = attack_positions[starting_positions], attack_positions[target_positions]
 		encounter = get_encounter(level, room_name, cell_index)
-		assert enemy_name in [entity.name for entity in encounter.entities[
-			EntityEnum.ENEMY.value]], f'{enemy_name} does not exist in {room_name}{" in cell " + str(cell_index) if cell_index != -1 else ""}.'
-		enemy: Enemy = encounter.entities[EntityEnum.ENEMY.value][
-			[entity.name for entity in encounter.entities[EntityEnum.ENEMY.value]].index(enemy_name)]
-		assert len(
-			enemy.attacks) < config.max_num_attacks, f'Enemy {enemy.name} has {config.max_num_attacks}, which is the maximum amount allowed.'
+		if not encounter.has_entity(EntityEnum.ENEMY, enemy_name):
+			raise AssertionError(f'{enemy_name} does not exist in {format_location(room_name, cell_index)}.')
+		enemy: Enemy = encounter.get_entity_by_name(EntityEnum.ENEMY, enemy_name)
+		if len(enemy.attacks) >= config.max_num_attacks:
+			raise AssertionError(f'Enemy {enemy.name} has {config.max_num_attacks}, which is the maximum amount allowed.')
 		attack = Attack(name=name, description=description,
 		                type=type_enum,
 		                starting_positions=starting_positions, target_positions=target_positions,
@@ -723,36 +788,49 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	                  target_positions: str,
 	                  base_dmg: float,
 	                  accuracy: float) -> str:
-		assert room_name != '', f'Parameter room_name should be provided.'
-		assert reference_name != '', f'Attack reference name should be specified.'
-		assert name != '', f'Attack name should be specified.'
-		assert description != '', f'Attack description should be specified.'
-		assert enemy_name != '', f'Enemy name should be specified.'
+		if room_name == '':
+			raise AssertionError('Parameter room_name should be provided.')
+		if reference_name == '':
+			raise AssertionError('Attack reference name should be specified.')
+		if name == '':
+			raise AssertionError('Attack name should be specified.')
+		if description == '':
+			raise AssertionError('Attack description should be specified.')
+		if enemy_name == '':
+			raise AssertionError('Enemy name should be specified.')
 		type_enum = get_enum_by_value(AttackType, attack_type)
-		assert type_enum is not None, f'Attack type "{attack_type}" is not a valid type: it must be one of {", ".join([t.value for t in AttackType])}.'
+		if type_enum is None:
+			raise AssertionError(f'Attack type "{attack_type}" is not a valid type: it must be one of {", ".join([t.value for t in AttackType])}.')
 		if type_enum == AttackType.DAMAGE:
-			assert config.min_base_dmg <= base_dmg <= config.max_base_dmg, f'Invalid base_dmg value: {base_dmg}; should be between {config.min_base_dmg} and {config.max_base_dmg}.'
+			if not config.min_base_dmg <= base_dmg <= config.max_base_dmg:
+				raise AssertionError(f'Invalid base_dmg value: {base_dmg}; should be between {config.min_base_dmg} and {config.max_base_dmg}.')
 		else:  # type is HEAL
-			assert -config.max_base_dmg <= base_dmg <= -config.min_base_dmg, f'Invalid base_dmg value: {base_dmg}; should be between {-config.max_base_dmg} and {-config.min_base_dmg}.'
-		assert len(
-			starting_positions) == 4, f'Invalid starting_positions value: {starting_positions}. Must be 4 characters long.'
-		assert len(
-			target_positions) == 4, f'Invalid target_positions value: {target_positions}. Must be 4 characters long.'
-		assert set(starting_positions).issubset(set['X', 'O']), f'Invalid starting_positions value: {starting_positions}. Must contain only "X" and "O" characters.'
-		assert set(starting_positions).issubset(set['X', 'O']), f'Invalid target_positions value: {target_positions}. Must contain only "X" and "O" characters.'
+			if not -config.max_base_dmg <= base_dmg <= -config.min_base_dmg:
+				raise AssertionError(f'Invalid base_dmg value: {base_dmg}; should be between {-config.max_base_dmg} and {-config.min_base_dmg}.')
+		if len(starting_positions) != 4:
+			raise AssertionError(f'Invalid starting_positions value: {starting_positions}. Must be 4 characters long.')
+		if len(target_positions) != 4:
+			raise AssertionError(f'Invalid target_positions value: {target_positions}. Must be 4 characters long.')
+		if starting_positions not in attack_positions:
+			raise AssertionError(f'Invalid starting_positions value: {starting_positions}. Must contain only "X" and "O" characters.')
+		if target_positions not in attack_positions:
+			raise AssertionError(f'Invalid target_positions value: {target_positions}. Must contain only "X" and "O" characters.')
+		starting_positions, target_positions = attack_positions[starting_positions], attack_positions[target_positions]
 		encounter = get_encounter(level, room_name, cell_index)
-		assert enemy_name in [entity.name for entity in encounter.entities[
-			EntityEnum.ENEMY.value]], f'{enemy_name} does not exist in {room_name}{" in cell " + str(cell_index) if cell_index != -1 else ""}.'
-		enemy: Enemy = encounter.entities[EntityEnum.ENEMY.value][
-			[entity.name for entity in encounter.entities[EntityEnum.ENEMY.value]].index(enemy_name)]
-		assert reference_name in [attack.name for attack in
-		                          enemy.attacks], f'{reference_name} is not an attack for {enemy_name}.'
-		idx = [attack.name for attack in enemy.attacks].index(reference_name)
-		attack = Attack(name=name, description=description,
-		                type=type_enum,
-		                starting_positions=starting_positions, target_positions=target_positions,
-		                base_dmg=base_dmg, accuracy=accuracy)
-		enemy.attacks[idx] = attack
+		if not encounter.has_entity(EntityEnum.ENEMY, enemy_name):
+			raise AssertionError(f'{enemy_name} does not exist in {format_location(room_name, cell_index)}.')
+		enemy: Enemy = encounter.get_entity_by_name(EntityEnum.ENEMY, enemy_name)
+		idx = next((i for i, attack in enumerate(enemy.attacks) if attack.name == reference_name), -1)
+		if idx == -1:
+			raise AssertionError(f'{reference_name} is not an attack for {enemy_name}.')
+		attack = enemy.attacks[idx]
+		# skip updates that would not change anything (a new attack is always active)
+		if (name, description, type_enum.value, starting_positions, target_positions, base_dmg, accuracy, True) != (
+				attack.name, attack.description, attack.type, attack.starting_positions, attack.target_positions, attack.base_dmg, attack.accuracy, attack.active):
+			enemy.attacks[idx] = Attack(name=name, description=description,
+			                            type=type_enum,
+			                            starting_positions=starting_positions, target_positions=target_positions,
+			                            base_dmg=base_dmg, accuracy=accuracy)
 		level.current_room = room_name
 		return f'Updated {reference_name} of {enemy_name}.'
 	
@@ -769,14 +847,19 @@ class DungeonCrawlerFunctions(GPTFunctionLibrary):
 	                  cell_index: int,
 	                  enemy_name: str,
 	                  name: str) -> str:
-		assert room_name != '', f'Parameter room_name should be provided.'
-		assert name != '', f'Attack name should be specified.'
-		assert enemy_name != '', f'Enemy name should be specified.'
+		if room_name == '':
+			raise AssertionError('Parameter room_name should be provided.')
+		if name == '':
+			raise AssertionError('Attack name should be specified.')
+		if enemy_name == '':
+			raise AssertionError('Enemy name should be specified.')
 		encounter = get_encounter(level, room_name, cell_index)
-		enemy: Enemy = encounter.entities[EntityEnum.ENEMY.value][
-			[entity.name for entity in encounter.entities[EntityEnum.ENEMY.value]].index(enemy_name)]
-		assert name in [attack.name for attack in enemy.attacks], f'{name} is not an attack for {enemy_name}.'
-		idx = [attack.name for attack in enemy.attacks].index(name)
+		if not encounter.has_entity(EntityEnum.ENEMY, enemy_name):
+			raise AssertionError(f'{enemy_name} does not exist in {format_location(room_name, cell_index)}.')
+		enemy: Enemy = encounter.get_entity_by_name(EntityEnum.ENEMY, enemy_name)
+		idx = next((i for i, attack in enumerate(enemy.attacks) if attack.name == name), -1)
+		if idx == -1:
+			raise AssertionError(f'{name} is not an attack for {enemy_name}.')
 		enemy.attacks.pop(idx)
 		level.current_room = room_name
 		return f'Removed {name} from {enemy_name}.'
@@ -7,6 +7,6 @@ setup(name='dungeon_despair_domain',
       long_description='',
       version='0.0.1',
       python_requires='>=3.11',
-      install_requires=['pydantic', 'pyyaml', 'gptfunctionutil'],
+      install_requires=['pydantic>=2', 'pyyaml', 'gptfunctionutil'],
       packages=['dungeon_despair'],
       )
\ No newline at end of file